@@ -5,7 +5,6 @@ Emit structured events to stdout as JSONL. Zero external dependencies.
 
 from __future__ import annotations
 
-import json
 import sys
 import time
 from datetime import UTC, datetime
@@ -20,6 +19,7 @@ from agentic_events.payloads import (
     GitPushPayload,
     GitRewritePayload,
 )
+from agentic_events.serialization import dumps_event, is_utf8_stream
 from agentic_events.types import EventType, SecurityDecision
 
 
@@ -55,6 +55,7 @@ class EventEmitter:
         self.session_id = session_id
         self.provider = provider
         self._output = output or sys.stdout
+        self._utf8_output = is_utf8_stream(self._output)
         self._tool_start_times: dict[str, float] = {}
 
     def emit(
@@ -83,7 +84,7 @@ class EventEmitter:
         }
 
         # Write as JSON line
-        print(json.dumps(event, default=str), file=self._output, flush=True)
+        print(dumps_event(event, self._utf8_output), file=self._output, flush=True)
 
         return event
 
@@ -33,6 +33,7 @@ import os
 from enum import Enum
 from pathlib import Path
 
+from .paths import DEFAULT_RECORDINGS_DIR
 from .player import SessionPlayer
 
 
@@ -82,10 +83,7 @@ def get_recordings_dir() -> Path:
     if env_path:
         return Path(env_path)
 
-    # Navigate from agentic_events/fixtures.py to repo root:
-    # fixtures.py -> agentic_events -> agentic_events -> python -> lib -> repo_root
-    repo_root = Path(__file__).parent.parent.parent.parent.parent
-    return repo_root / "providers/workspaces/claude-cli/fixtures/recordings"
+    return DEFAULT_RECORDINGS_DIR
 
 
 def list_recordings(include_directories: bool = True) -> list[Path]:
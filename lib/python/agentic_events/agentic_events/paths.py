@@ -0,0 +1,26 @@
+"""Filesystem locations shared across agentic_events modules."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Canonical recordings directory, resolved once at import. Walks up from
+# agentic_events/paths.py -> agentic_events -> agentic_events -> python
+# -> lib -> repo_root with a single lexical join instead of a .parent chain.
+DEFAULT_RECORDINGS_DIR = Path(
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "..",
+            "..",
+            "..",
+            "providers",
+            "workspaces",
+            "claude-cli",
+            "fixtures",
+            "recordings",
+        )
+    )
+)
@@ -14,6 +14,13 @@ Usage:
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
+from functools import cache
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Field names of a payload class, introspected once per class."""
+    return tuple(f.name for f in fields(cls))
 
 
 def _strip_empty(dc: object) -> dict[str, object]:
@@ -24,12 +31,11 @@ def _strip_empty(dc: object) -> dict[str, object]:
     The ``operation`` field is always included as it serves as the event
     type discriminator.
     """
-    result: dict[str, object] = {}
-    for f in fields(dc):  # type: ignore[arg-type]
-        val = getattr(dc, f.name)
-        if f.name == "operation" or val:
-            result[f.name] = val
-    return result
+    return {
+        name: val
+        for name in _field_names(type(dc))
+        if (val := getattr(dc, name)) or name == "operation"
+    }
 
 
 # ---------------------------------------------------------------------------
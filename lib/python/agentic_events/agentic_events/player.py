@@ -39,6 +39,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; json.loads also accepts bytes
+    orjson = None
+
+
+def _loads(line: bytes) -> Any:
+    """Parse one JSONL line, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # NaN, Infinity or lone surrogates, as written by stdlib json
+    return json.loads(line)
+
 
 @dataclass
 class RecordingMetadata:
@@ -187,14 +202,15 @@ class SessionPlayer:
 
     def _load_events_file(self, events_path: Path) -> None:
         """Load events from a JSONL file."""
-        with open(events_path) as f:
+        # Read bytes so lines go straight to the parser without a str decode
+        with open(events_path, "rb") as f:
             lines = f.readlines()
 
         if not lines:
             raise ValueError(f"Empty recording file: {events_path}")
 
         # First line should be metadata
-        first_line = json.loads(lines[0])
+        first_line = _loads(lines[0])
         if "_recording" in first_line:
             self._metadata = RecordingMetadata.from_dict(first_line)
             event_lines = lines[1:]
@@ -218,7 +234,7 @@ class SessionPlayer:
         for line in event_lines:
             line = line.strip()
             if line:
-                event = json.loads(line)
+                event = _loads(line)
                 normalized = self._normalize_event(event)
                 self._events.append(normalized)
 
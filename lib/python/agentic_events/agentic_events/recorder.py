@@ -37,6 +37,11 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import IO, Any
 
+from agentic_events.paths import DEFAULT_RECORDINGS_DIR
+from agentic_events.serialization import dumps_event
+
+_WRITE_BUFFER_SIZE = 1 << 16
+
 
 class SessionRecorder:
     """Record agent session events with timing for test playback.
@@ -44,6 +49,10 @@ class SessionRecorder:
     Events are written as JSONL with timing offsets from session start.
     The first line contains recording metadata (cli version, model, etc).
 
+    Events are buffered in memory and only reach disk on flush() or close().
+    Use the recorder as a context manager (or call flush() at checkpoints) so
+    a crash does not lose the buffered events.
+
     Supports two output formats:
     1. Legacy .jsonl file (default): Single file with metadata + events
     2. Directory format: When workspace files are captured
@@ -103,7 +112,12 @@ class SessionRecorder:
         """
         self._output_path = Path(output_path)
         self._output_path.parent.mkdir(parents=True, exist_ok=True)
-        self._output: IO[str] = open(self._output_path, "w")
+        # Events are only read back in close(), so let a large write buffer
+        # coalesce them instead of flushing a syscall per event. Anything still
+        # buffered is lost if the process dies before flush() or close().
+        self._output: IO[str] = open(
+            self._output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        )
 
         self._cli_version = cli_version
         self._model = model
@@ -153,9 +167,8 @@ class SessionRecorder:
         if self.session_id is None and "session_id" in event:
             self.session_id = event["session_id"]
 
-        # Write as JSONL
-        self._output.write(json.dumps(recorded_event, default=str) + "\n")
-        self._output.flush()
+        # Write as JSONL (buffered; flushed when the recorder is closed)
+        self._output.write(dumps_event(recorded_event) + "\n")
 
         self._event_count += 1
         return recorded_event
@@ -200,6 +213,16 @@ class SessionRecorder:
 
         self._workspace_files[path] = content
 
+    def flush(self) -> None:
+        """Write buffered events to disk without finalizing the recording.
+
+        No-op once the recorder has been closed.
+        """
+        if self._closed:
+            return
+
+        self._output.flush()
+
     def close(self) -> Path:
         """Finalize the recording and write metadata header.
 
@@ -219,7 +242,7 @@ class SessionRecorder:
         self._output.close()
 
         # Read existing events
-        with open(self._output_path) as f:
+        with open(self._output_path, encoding="utf-8") as f:
             events = f.readlines()
 
         # Build metadata
@@ -251,7 +274,7 @@ class SessionRecorder:
 
     def _write_jsonl_format(self, events: list[str], metadata: dict[str, Any]) -> Path:
         """Write legacy single-file format."""
-        with open(self._output_path, "w") as f:
+        with open(self._output_path, "w", encoding="utf-8") as f:
             f.write(json.dumps(metadata) + "\n")
             f.writelines(events)
         return self._output_path
@@ -275,7 +298,7 @@ class SessionRecorder:
 
         # Write events.jsonl
         events_path = dir_path / "events.jsonl"
-        with open(events_path, "w") as f:
+        with open(events_path, "w", encoding="utf-8") as f:
             f.write(json.dumps(metadata) + "\n")
             f.writelines(events)
 
@@ -356,10 +379,7 @@ class SessionRecorder:
 
         if output_dir is None:
             # Use standard fixtures directory
-            output_dir = (
-                Path(__file__).parent.parent.parent.parent
-                / "providers/workspaces/claude-cli/fixtures/recordings"
-            )
+            output_dir = DEFAULT_RECORDINGS_DIR
         else:
             output_dir = Path(output_dir)
 
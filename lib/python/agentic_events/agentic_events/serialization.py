@@ -0,0 +1,72 @@
+"""JSON line serialization shared by the event emitter and session recorder.
+
+orjson is used when installed, but only where it produces the same JSON values
+as ``json.dumps(event, default=str)``. Zero required dependencies.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import math
+from enum import Enum
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json keeps the package dependency-free
+    orjson = None
+
+# Route datetimes and dataclasses to ``default`` instead of orjson's own encoding
+_ORJSON_OPTIONS = (
+    (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson else 0
+)
+
+
+def _orjson_unsupported(obj: Any) -> Any:
+    """orjson ``default``: reject anything json.dumps would hand to ``str``."""
+    raise TypeError
+
+
+def _orjson_equivalent(obj: Any) -> bool:
+    """True if orjson encodes ``obj`` to the same JSON values json.dumps would.
+
+    orjson writes NaN/Infinity as null and plain Enum members as their value,
+    where json.dumps writes NaN/Infinity literally and ``str(member)``.
+    """
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_orjson_equivalent(value) for value in obj.values())
+    if isinstance(obj, list | tuple):
+        return all(_orjson_equivalent(item) for item in obj)
+    if isinstance(obj, Enum):
+        return isinstance(obj, str | int)
+    return True
+
+
+def is_utf8_stream(stream: IO[str]) -> bool:
+    """True if non-ASCII text written to ``stream`` is stored as UTF-8 (or kept as str)."""
+    encoding = getattr(stream, "encoding", None)
+    if encoding is None:
+        return True  # in-memory text stream such as io.StringIO
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def dumps_event(event: dict[str, Any], utf8: bool = True) -> str:
+    """Serialize an event to a single JSON line (without the newline).
+
+    Produces the same JSON values as ``json.dumps(event, default=str)``. orjson
+    is used only when the destination is UTF-8 (it writes non-ASCII characters
+    unescaped) and the event holds nothing it encodes differently; everything
+    else goes through json.dumps. The orjson line is more compact.
+    """
+    if utf8 and orjson is not None and _orjson_equivalent(event):
+        try:
+            return orjson.dumps(event, default=_orjson_unsupported, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # datetimes, namedtuples, non-str keys, >64-bit ints, ...
+    return json.dumps(event, default=str)
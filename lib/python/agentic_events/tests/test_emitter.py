@@ -2,6 +2,9 @@
 
 import io
 import json
+from datetime import UTC, datetime
+from enum import Enum
+from typing import NamedTuple
 
 import pytest
 
@@ -10,6 +13,15 @@ from agentic_events import EventEmitter, EventType, SecurityDecision
 pytestmark = pytest.mark.unit
 
 
+class _Color(Enum):
+    RED = 1
+
+
+class _Point(NamedTuple):
+    x: int
+    y: int
+
+
 class TestEventEmitter:
     """Tests for EventEmitter class."""
 
@@ -154,3 +166,53 @@ class TestEventEmitter:
             assert "event_type" in event
             assert "timestamp" in event
             assert "session_id" in event
+
+    @pytest.mark.parametrize(
+        "context",
+        [
+            {"when": datetime(2025, 1, 1, tzinfo=UTC)},
+            {"by_id": {1: "a"}},
+            {"big": 2**70},
+            {"nan": float("nan"), "inf": float("inf")},
+            {"color": _Color.RED},
+            {"point": _Point(1, 2)},
+        ],
+        ids=["datetime", "int-keys", "big-int", "non-finite", "enum", "namedtuple"],
+    )
+    def test_non_json_values_serialized_like_stdlib(self, context):
+        """Test that values orjson encodes differently fall back to json.dumps(default=str)."""
+        output = io.StringIO()
+        emitter = EventEmitter(session_id="test-123", output=output)
+
+        event = emitter.emit("custom", context)
+
+        assert output.getvalue() == json.dumps(event, default=str) + "\n"
+
+    @pytest.mark.parametrize(
+        ("encoding", "errors"),
+        [("ascii", "strict"), ("cp1252", "backslashreplace")],
+    )
+    def test_non_utf8_stream_gets_ascii_escaped_line(self, encoding, errors):
+        """Test that non-ASCII text stays valid JSON on streams that can't encode it."""
+        raw = io.BytesIO()
+        output = io.TextIOWrapper(raw, encoding=encoding, errors=errors)
+        emitter = EventEmitter(session_id="test-123", output=output)
+
+        emitter.emit("custom", {"msg": "héllo 😀"})
+
+        line = raw.getvalue().decode("ascii")
+        assert "\\u00e9" in line
+        assert "\\U" not in line
+        assert json.loads(line)["context"] == {"msg": "héllo 😀"}
+
+    def test_utf8_stream_line_is_valid_json(self):
+        """Test the emitted UTF-8 line itself, not just the returned dict."""
+        raw = io.BytesIO()
+        output = io.TextIOWrapper(raw, encoding="utf-8")
+        emitter = EventEmitter(session_id="test-123", output=output)
+
+        emitter.emit("custom", {"msg": "héllo 😀"})
+
+        line = raw.getvalue().decode("utf-8")
+        assert line.endswith("\n")
+        assert json.loads(line)["context"] == {"msg": "héllo 😀"}
@@ -82,6 +82,23 @@ class TestSessionRecorder:
         assert event2["_offset_ms"] > event1["_offset_ms"]
         assert event2["_offset_ms"] >= 50  # At least 50ms later
 
+    def test_flush_writes_buffered_events(self, tmp_path: Path):
+        """flush() puts recorded events on disk before close()."""
+        output_file = tmp_path / "test.jsonl"
+        recorder = SessionRecorder(
+            output_path=output_file,
+            cli_version="1.0.52",
+            model="test-model",
+        )
+        recorder.record({"event_type": "session_started", "session_id": "test-123"})
+
+        recorder.flush()
+
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[0])["event_type"] == "session_started"
+        recorder.close()
+        recorder.flush()  # no-op after close
+
     def test_generate_filename(self):
         """Test filename generation."""
         filename = SessionRecorder.generate_filename(
@@ -327,6 +344,36 @@ class TestRoundTrip:
             assert played["event_type"] == orig["event_type"]
             assert played["session_id"] == orig["session_id"]
 
+    def test_roundtrip_non_ascii(self, tmp_path: Path):
+        """Non-ASCII text is written as UTF-8 regardless of the locale encoding."""
+        recording_file = tmp_path / "unicode.jsonl"
+        event = {"event_type": "custom", "session_id": "u-1", "context": {"msg": "héllo 😀"}}
+
+        with SessionRecorder(
+            output_path=recording_file,
+            cli_version="1.0.52",
+            model="test-model",
+        ) as recorder:
+            recorder.record(event)
+
+        recording_file.read_bytes().decode("utf-8")  # raises if not UTF-8
+        played = SessionPlayer(recording_file).get_events()
+        assert played[0]["context"] == {"msg": "héllo 😀"}
+
+    def test_player_loads_stdlib_only_json(self, tmp_path: Path):
+        """NaN, Infinity and lone surrogates written by stdlib json still load."""
+        recording_file = tmp_path / "stdlib.jsonl"
+        event = {"event_type": "custom", "context": {"nan": float("nan"), "s": "\ud800"}}
+        recording_file.write_text(
+            json.dumps(event) + "\n" + json.dumps({"event_type": "x", "inf": float("inf")}) + "\n"
+        )
+
+        played = SessionPlayer(recording_file).get_events()
+
+        assert played[0]["context"]["s"] == "\ud800"
+        assert played[0]["context"]["nan"] != played[0]["context"]["nan"]
+        assert played[1]["inf"] == float("inf")
+
 
 class TestSchemaVersioning:
     """Tests for event schema versioning."""
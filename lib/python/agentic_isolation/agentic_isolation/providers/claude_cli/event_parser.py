@@ -29,7 +29,7 @@ from agentic_isolation.providers.claude_cli.types import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentState:
     """Tracks state of an active subagent.
 
@@ -164,9 +164,11 @@ DISPATCH = {
 def main() -> None:
     """Main entry point."""
     try:
-        input_data = ""
+        # Read raw bytes: json.loads accepts UTF-8 bytes directly, which skips
+        # the intermediate str decode of potentially large tool payloads.
+        input_data = b""
         if not sys.stdin.isatty():
-            input_data = sys.stdin.read()
+            input_data = sys.stdin.buffer.read()
 
         if not input_data:
             return
@@ -13,6 +13,8 @@ Events are emitted as JSONL to stdout, captured by the agent runner
 and stored in TimescaleDB for observability.
 """
 
+import functools
+import importlib.util
 import json
 import os
 import sys
@@ -28,6 +30,9 @@ TOOL_VALIDATORS: dict[str, list[str]] = {
     "MultiEdit": ["security.file"],
 }
 
+# Validator modules live in hooks/validators/, resolved once at import
+_VALIDATORS_DIR = Path(__file__).parent.parent / "validators"
+
 # === EVENT EMITTER (lazy initialized) ===
 _emitter = None
 
@@ -56,14 +61,23 @@ def _get_emitter(session_id: str | None = None):
 
 
 def load_validator(validator_name: str, validators_dir: Path):
-    """Dynamically load a validator module."""
+    """Dynamically load a validator module.
+
+    Modules are cached per (name, path, mtime), so repeat calls in one
+    process skip re-executing the module, and an edited file is reloaded.
+    """
     module_path = validators_dir / (validator_name.replace(".", "/") + ".py")
 
-    if not module_path.exists():
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except OSError:
         return None
 
-    import importlib.util
+    return _load_validator_cached(validator_name, str(module_path), mtime_ns)
+
 
+@functools.lru_cache(maxsize=32)
+def _load_validator_cached(validator_name: str, module_path: str, mtime_ns: int):
     spec = importlib.util.spec_from_file_location(validator_name, module_path)
     if spec and spec.loader:
         module = importlib.util.module_from_spec(spec)
@@ -72,6 +86,19 @@ def load_validator(validator_name: str, validators_dir: Path):
     return None
 
 
+def _input_preview(tool_input: dict, limit: int = 500) -> str:
+    """First `limit` chars of json.dumps(tool_input), without encoding it all.
+
+    Top-level strings (e.g. Write content) are cut to `limit` before dumping.
+    JSON escaping never shortens a string, so the prefix is unchanged.
+    """
+    trimmed = {
+        k: v[:limit] if isinstance(v, str) and len(v) > limit else v
+        for k, v in tool_input.items()
+    }
+    return json.dumps(trimmed)[:limit]
+
+
 def run_validators(tool_name: str, tool_input: dict, context: dict) -> dict:
     """Run all validators for a tool, return first failure or success."""
     validator_names = TOOL_VALIDATORS.get(tool_name, [])
@@ -79,11 +106,10 @@ def run_validators(tool_name: str, tool_input: dict, context: dict) -> dict:
     if not validator_names:
         return {"safe": True, "reason": None, "validators_run": []}
 
-    validators_dir = Path(__file__).parent.parent / "validators"
     validators_run = []
 
     for validator_name in validator_names:
-        module = load_validator(validator_name, validators_dir)
+        module = load_validator(validator_name, _VALIDATORS_DIR)
         if module and hasattr(module, "validate"):
             validators_run.append(validator_name)
             result = module.validate(tool_input, context)
@@ -94,17 +120,25 @@ def run_validators(tool_name: str, tool_input: dict, context: dict) -> dict:
     return {"safe": True, "reason": None, "validators_run": validators_run}
 
 
+def _write_decision(decision: dict) -> None:
+    """Write the hook decision to stdout as one JSON line in a single write."""
+    sys.stdout.write(json.dumps(decision) + "\n")
+    sys.stdout.flush()
+
+
 def main() -> None:
     """Main entry point."""
     try:
         # Read event from stdin
-        input_data = ""
+        input_data = b""
         if not sys.stdin.isatty():
-            input_data = sys.stdin.read()
+            input_data = sys.stdin.buffer.read()
 
         if not input_data:
             return  # No output = allow
 
+        # Stdlib json on purpose: it accepts input (lone surrogates, NaN, 1e400)
+        # that stricter parsers reject, and a parse failure here fails open
         event = json.loads(input_data)
 
         # Extract fields
@@ -125,7 +159,7 @@ def main() -> None:
             emitter.tool_started(
                 tool_name=tool_name,
                 tool_use_id=tool_use_id,
-                input_preview=json.dumps(tool_input)[:500] if tool_input else "",
+                input_preview=_input_preview(tool_input) if tool_input else "",
             )
 
         # Run validators
@@ -144,17 +178,15 @@ def main() -> None:
 
         # Only output when blocking - no output means allow
         if decision == "block":
-            print(
-                json.dumps(
-                    {
-                        "hookSpecificOutput": {
-                            "permissionDecision": "deny",
-                            "permissionDecisionReason": result.get(
-                                "reason", "Blocked by security validator"
-                            ),
-                        }
+            _write_decision(
+                {
+                    "hookSpecificOutput": {
+                        "permissionDecision": "deny",
+                        "permissionDecisionReason": result.get(
+                            "reason", "Blocked by security validator"
+                        ),
                     }
-                )
+                }
             )
 
     except Exception:
@@ -9,9 +9,12 @@ This handler:
 4. Returns allow/block decision
 """
 
+import functools
+import importlib.util
 import json
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 # === VALIDATOR COMPOSITION ===
@@ -20,6 +23,9 @@ PROMPT_VALIDATORS: list[str] = [
     "prompt.pii",
 ]
 
+# Validator modules live in hooks/validators/, resolved once at import
+_VALIDATORS_DIR = Path(__file__).parent.parent / "validators"
+
 # === EVENT EMITTER (lazy initialized) ===
 _emitter = None
 
@@ -48,14 +54,23 @@ def _get_emitter(session_id: str | None = None):
 
 
 def load_validator(validator_name: str, validators_dir: Path):
-    """Dynamically load a validator module."""
+    """Dynamically load a validator module.
+
+    Modules are cached per (name, path, mtime), so repeat calls in one
+    process skip re-executing the module, and an edited file is reloaded.
+    """
     module_path = validators_dir / (validator_name.replace(".", "/") + ".py")
 
-    if not module_path.exists():
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except OSError:
         return None
 
-    import importlib.util
+    return _load_validator_cached(validator_name, str(module_path), mtime_ns)
 
+
+@functools.lru_cache(maxsize=32)
+def _load_validator_cached(validator_name: str, module_path: str, mtime_ns: int):
     spec = importlib.util.spec_from_file_location(validator_name, module_path)
     if spec and spec.loader:
         module = importlib.util.module_from_spec(spec)
@@ -64,35 +79,54 @@ def load_validator(validator_name: str, validators_dir: Path):
     return None
 
 
+def _get_prompt_validators() -> list[tuple[str, Callable]]:
+    """Resolve PROMPT_VALIDATORS; missing or invalid modules are skipped.
+
+    Goes through load_validator on every call so its mtime-keyed cache
+    decides when an edited validator is re-executed.
+    """
+    loaded = []
+    for validator_name in PROMPT_VALIDATORS:
+        module = load_validator(validator_name, _VALIDATORS_DIR)
+        if module and hasattr(module, "validate"):
+            loaded.append((validator_name, module.validate))
+    return loaded
+
+
 def run_validators(prompt: str, context: dict) -> dict:
     """Run all prompt validators, return first failure or success."""
-    validators_dir = Path(__file__).parent.parent / "validators"
     validators_run = []
 
-    for validator_name in PROMPT_VALIDATORS:
-        module = load_validator(validator_name, validators_dir)
-        if module and hasattr(module, "validate"):
-            validators_run.append(validator_name)
-            # For prompt validators, we pass the prompt as tool_input
-            result = module.validate({"prompt": prompt}, context)
-            if not result.get("safe", True):
-                result["validators_run"] = validators_run
-                return result
+    for validator_name, validate in _get_prompt_validators():
+        validators_run.append(validator_name)
+        # For prompt validators, we pass the prompt as tool_input
+        result = validate({"prompt": prompt}, context)
+        if not result.get("safe", True):
+            result["validators_run"] = validators_run
+            return result
 
     return {"safe": True, "reason": None, "validators_run": validators_run}
 
 
+def _write_decision(decision: dict) -> None:
+    """Write the hook decision to stdout as one JSON line in a single write."""
+    sys.stdout.write(json.dumps(decision) + "\n")
+    sys.stdout.flush()
+
+
 def main() -> None:
     """Main entry point."""
     try:
         # Read event from stdin
-        input_data = ""
+        input_data = b""
         if not sys.stdin.isatty():
-            input_data = sys.stdin.read()
+            input_data = sys.stdin.buffer.read()
 
         if not input_data:
             return  # No output = allow
 
+        # Stdlib json on purpose: it accepts input (lone surrogates, NaN, 1e400)
+        # that stricter parsers reject, and a parse failure here fails open
         event = json.loads(input_data)
 
         # Extract prompt - could be in different fields
@@ -121,13 +155,11 @@ def main() -> None:
 
         # Only output when blocking - no output means allow
         if decision == "block":
-            print(
-                json.dumps(
-                    {
-                        "decision": "block",
-                        "reason": result.get("reason", "Blocked by prompt validator"),
-                    }
-                )
+            _write_decision(
+                {
+                    "decision": "block",
+                    "reason": result.get("reason", "Blocked by prompt validator"),
+                }
             )
 
     except Exception:
@@ -14,27 +14,25 @@ PII_PATTERNS: list[tuple[str, str, str]] = [
     # SSN (US Social Security Number)
     (r"\b\d{3}-\d{2}-\d{4}\b", "SSN", "high"),
     (r"\b\d{9}\b", "potential SSN (9 digits)", "medium"),
-    # Credit card numbers - with or without dashes/spaces
+    # Credit card numbers - with or without dashes/spaces. Separators are
+    # optional, so each pattern also covers the undashed digit run; separate
+    # undashed patterns would only report the same card twice.
     # Visa: starts with 4, 13-16 digits
     (r"\b4[0-9]{3}[-\s]?[0-9]{4}[-\s]?[0-9]{4}[-\s]?[0-9]{1,4}\b", "Visa card", "high"),
-    (r"\b4[0-9]{12}(?:[0-9]{3})?\b", "Visa card", "high"),
     # Mastercard: starts with 51-55 or 2221-2720, 16 digits
     (
         r"\b5[1-5][0-9]{2}[-\s]?[0-9]{4}[-\s]?[0-9]{4}[-\s]?[0-9]{4}\b",
         "Mastercard",
         "high",
     ),
-    (r"\b5[1-5][0-9]{14}\b", "Mastercard", "high"),
     # Amex: starts with 34 or 37, 15 digits
     (r"\b3[47][0-9]{2}[-\s]?[0-9]{6}[-\s]?[0-9]{5}\b", "Amex card", "high"),
-    (r"\b3[47][0-9]{13}\b", "Amex card", "high"),
     # Discover: starts with 6011, 622126-622925, 644-649, 65, 16 digits
     (
         r"\b6(?:011|5[0-9]{2})[-\s]?[0-9]{4}[-\s]?[0-9]{4}[-\s]?[0-9]{4}\b",
         "Discover card",
         "high",
     ),
-    (r"\b6(?:011|5[0-9]{2})[0-9]{12}\b", "Discover card", "high"),
     # Phone numbers (various formats)
     (
         r"\b(?:\+1[-.\s]?)?\(?[2-9]\d{2}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
@@ -78,19 +76,46 @@ CONTEXT_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
+# Single-pass union gates. Patterns overlap (e.g. a 9-digit run is both a
+# potential SSN and part of a card number), so one alternation can't produce
+# per-pattern counts; it only decides whether the per-pattern scan is needed.
+# Stdlib re only: re2's \d, \b and \s are ASCII-only, so an re2 gate would miss
+# e.g. fullwidth digits that the per-pattern scan below still matches.
+_PII_ANY = re.compile("|".join(f"(?:{p})" for p, _, _ in PII_PATTERNS), re.IGNORECASE)
+_CONTEXT_ANY = re.compile("|".join(f"(?:{p})" for p, _ in CONTEXT_PATTERNS), re.IGNORECASE)
+
+# Every PII pattern needs at least one digit or an "@" to match, so a prompt
+# without either can skip the PII scan entirely.
+_PII_TRIGGER = re.compile(r"[\d@]")
+
+# Per-pattern regexes, compiled once at import for attribution after a gate hit
+_PII_COMPILED: list[tuple[re.Pattern[str], str, str]] = [
+    (re.compile(pattern, re.IGNORECASE), pii_type, risk_level)
+    for pattern, pii_type, risk_level in PII_PATTERNS
+]
+_CONTEXT_COMPILED: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern, re.IGNORECASE), context_type)
+    for pattern, context_type in CONTEXT_PATTERNS
+]
+
+
 def _scan_pii_patterns(prompt: str) -> tuple[list[dict[str, str | int]], str]:
     detected_pii: list[dict[str, str | int]] = []
     highest_risk = "none"
     risk_order = {"none": 0, "low": 1, "medium": 2, "high": 3}
 
-    for pattern, pii_type, risk_level in PII_PATTERNS:
-        matches = re.findall(pattern, prompt, re.IGNORECASE)
-        if matches:
+    if not _PII_TRIGGER.search(prompt) or not _PII_ANY.search(prompt):
+        return detected_pii, highest_risk
+
+    for regex, pii_type, risk_level in _PII_COMPILED:
+        # Only the count is reported, so don't materialize the match strings
+        count = sum(1 for _ in regex.finditer(prompt))
+        if count:
             detected_pii.append(
                 {
                     "type": pii_type,
                     "risk": risk_level,
-                    "count": len(matches),
+                    "count": count,
                 }
             )
             if risk_order.get(risk_level, 0) > risk_order.get(highest_risk, 0):
@@ -101,8 +126,10 @@ def _scan_pii_patterns(prompt: str) -> tuple[list[dict[str, str | int]], str]:
 
 def _scan_context_patterns(prompt: str) -> list[str]:
     detected_context: list[str] = []
-    for pattern, context_type in CONTEXT_PATTERNS:
-        if re.search(pattern, prompt, re.IGNORECASE):
+    if not _CONTEXT_ANY.search(prompt):
+        return detected_context
+    for regex, context_type in _CONTEXT_COMPILED:
+        if regex.search(prompt):
             detected_context.append(context_type)
     return detected_context
 
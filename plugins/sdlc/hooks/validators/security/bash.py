@@ -82,6 +82,22 @@ GIT_DANGEROUS_PATTERNS: list[tuple[str, str]] = [
     (r"\bgit\s+branch\s+(?:-d|-D|--delete)\s+", "git branch delete (destructive)"),
 ]
 
+# Compiled once at import. The union regex is a single-pass gate for the
+# common (safe) case; on a hit, the ordered per-pattern list attributes the
+# block to the first matching pattern, same as a plain sequential scan.
+_BLOCKED_COMPILED: list[tuple[re.Pattern[str], str, str]] = [
+    (re.compile(pattern, re.IGNORECASE), pattern, description)
+    for pattern, description in DANGEROUS_PATTERNS + GIT_DANGEROUS_PATTERNS
+]
+_BLOCKED_ANY = re.compile(
+    "|".join(f"(?:{pattern})" for pattern, _ in DANGEROUS_PATTERNS + GIT_DANGEROUS_PATTERNS),
+    re.IGNORECASE,
+)
+_SUSPICIOUS_COMPILED: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in SUSPICIOUS_PATTERNS
+]
+
 
 def validate(
     tool_input: dict[str, Any], context: dict[str, Any] | None = None
@@ -102,23 +118,23 @@ def validate(
         return {"safe": True}
 
     # Check dangerous patterns
-    for pattern, description in DANGEROUS_PATTERNS + GIT_DANGEROUS_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return {
-                "safe": False,
-                "reason": f"Dangerous command blocked: {description}",
-                "metadata": {
-                    "pattern": pattern,
-                    "command_preview": command[:100],
-                    "risk_level": "critical",
-                },
-            }
+    if _BLOCKED_ANY.search(command):
+        for regex, pattern, description in _BLOCKED_COMPILED:
+            if regex.search(command):
+                return {
+                    "safe": False,
+                    "reason": f"Dangerous command blocked: {description}",
+                    "metadata": {
+                        "pattern": pattern,
+                        "command_preview": command[:100],
+                        "risk_level": "critical",
+                    },
+                }
 
     # Check suspicious patterns (don't block, just note in metadata)
-    suspicious: list[str] = []
-    for pattern, description in SUSPICIOUS_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            suspicious.append(description)
+    suspicious = [
+        description for regex, description in _SUSPICIOUS_COMPILED if regex.search(command)
+    ]
 
     return {
         "safe": True,
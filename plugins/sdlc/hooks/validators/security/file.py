@@ -6,8 +6,9 @@ Atomic validator that checks file operations for security issues.
 Pure function - no side effects, no analytics, no stdin/stdout handling.
 """
 
-import hashlib
+import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +29,10 @@ BLOCKED_PATHS: list[str] = [
     "/dev/",
 ]
 
+# Single C-level prefix test / set lookup for the common (not blocked) case
+_BLOCKED_PREFIXES: tuple[str, ...] = tuple(BLOCKED_PATHS)
+_BLOCKED_EXACT: frozenset[str] = frozenset(p.rstrip("/") for p in BLOCKED_PATHS)
+
 # Paths that require extra scrutiny (warn but don't block)
 SENSITIVE_PATHS: list[str] = [
     "/etc/",
@@ -41,6 +46,12 @@ SENSITIVE_PATHS: list[str] = [
     "~/.config/",
 ]
 
+# SENSITIVE_PATHS with ~ expanded, paired with the original entry for reasons
+_EXPANDED_SENSITIVE: list[tuple[str, str]] = [
+    (os.path.expanduser(p).rstrip("/"), p) for p in SENSITIVE_PATHS
+]
+_SENSITIVE_PREFIXES: tuple[str, ...] = tuple(expanded for expanded, _ in _EXPANDED_SENSITIVE)
+
 # File patterns that should never be read/written by AI
 SENSITIVE_FILE_PATTERNS: list[tuple[str, str]] = [
     (r"\.env(?:\.(?!example|template|test|sample|defaults)\w+)?$", "environment file"),
@@ -69,10 +80,130 @@ SENSITIVE_CONTENT_PATTERNS: list[tuple[str, str]] = [
     (r"xox[baprs]-[0-9A-Za-z-]+", "Slack token"),
 ]
 
+# File patterns that are only an end-anchored literal (or a few literal
+# alternatives), expanded to their suffixes so check_file_pattern can use
+# str.endswith instead of the regex engine. Keyed by the pattern string;
+# patterns not listed here keep their compiled regex.
+_LITERAL_SUFFIXES: dict[str, tuple[str, ...]] = {
+    r"\.pem$": (".pem",),
+    r"(?:private|server|signing|tls|ssl|ca|root|intermediate|client|apikey)\.key$": (
+        "private.key",
+        "server.key",
+        "signing.key",
+        "tls.key",
+        "ssl.key",
+        "ca.key",
+        "root.key",
+        "intermediate.key",
+        "client.key",
+        "apikey.key",
+    ),
+    r"id_(?:rsa|dsa|ecdsa|ed25519)\.key$": (
+        "id_rsa.key",
+        "id_dsa.key",
+        "id_ecdsa.key",
+        "id_ed25519.key",
+    ),
+    r"id_rsa(?:\.pub)?$": ("id_rsa", "id_rsa.pub"),
+    r"id_ed25519(?:\.pub)?$": ("id_ed25519", "id_ed25519.pub"),
+    r"\.p12$": (".p12",),
+    r"\.pfx$": (".pfx",),
+    r"credentials(?:\.json)?$": ("credentials", "credentials.json"),
+    r"secrets\.ya?ml$": ("secrets.yml", "secrets.yaml"),
+    r"\.htpasswd$": (".htpasswd",),
+    r"\.netrc$": (".netrc",),
+    r"\.npmrc$": (".npmrc",),
+    r"\.pypirc$": (".pypirc",),
+}
+
+
+def _suffix_matcher(pattern: str, suffixes: tuple[str, ...]) -> Callable[[str], bool]:
+    """Case-insensitive endswith over literal suffixes, mirroring a `...$` regex.
+
+    Only ASCII text takes the endswith path: re.IGNORECASE folds some non-ASCII
+    characters (e.g. dotless ı) onto ASCII letters while str.casefold()
+    expands others (e.g. ß -> ss), so non-ASCII text goes through the regex.
+    """
+    regex = re.compile(pattern, re.IGNORECASE)
+    # `$` also matches just before a trailing newline
+    candidates = suffixes + tuple(suffix + "\n" for suffix in suffixes)
+
+    def match(text: str) -> bool:
+        if text.isascii():
+            return text.lower().endswith(candidates)
+        return regex.search(text) is not None
+
+    return match
+
+
+# Built once at import; the checks below iterate these instead of going
+# through re's pattern cache on every call
+_FILE_PATTERNS_COMPILED: list[tuple[Callable[[str], object], str]] = [
+    (
+        _suffix_matcher(pattern, _LITERAL_SUFFIXES[pattern])
+        if pattern in _LITERAL_SUFFIXES
+        else re.compile(pattern, re.IGNORECASE).search,
+        description,
+    )
+    for pattern, description in SENSITIVE_FILE_PATTERNS
+]
+_CONTENT_PATTERNS_COMPILED: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern), description) for pattern, description in SENSITIVE_CONTENT_PATTERNS
+]
+
+# One-pass gate over the (possibly large) content; the ordered list above only
+# runs on a hit, so the reported description matches a sequential scan.
+# Stdlib re only: re2 encodes str to UTF-8 and raises on lone surrogates,
+# which would reach the handler's fail-open path.
+_CONTENT_ANY = re.compile("|".join(f"(?:{p})" for p, _ in SENSITIVE_CONTENT_PATTERNS))
+# Literals each content pattern requires (one of them must appear in any
+# match), keyed by pattern string. A substring miss on every literal proves no
+# pattern can match, without entering the regex engine.
+_CONTENT_REQUIRED_LITERALS: dict[str, tuple[str, ...]] = {
+    r"-----BEGIN (?:RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----": ("-----BEGIN ",),
+    r"AKIA[0-9A-Z]{16}": ("AKIA",),
+    r"(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9_]{36}": ("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
+    r"sk-[A-Za-z0-9]{48}": ("sk-",),
+    r"xox[baprs]-[0-9A-Za-z-]+": ("xox",),
+}
+# None if any pattern lacks declared literals: the prefilter could then miss
+# a match, so it is skipped rather than failing open
+_CONTENT_LITERALS: tuple[str, ...] | None = (
+    tuple(
+        literal
+        for pattern, _ in SENSITIVE_CONTENT_PATTERNS
+        for literal in _CONTENT_REQUIRED_LITERALS[pattern]
+    )
+    if all(pattern in _CONTENT_REQUIRED_LITERALS for pattern, _ in SENSITIVE_CONTENT_PATTERNS)
+    else None
+)
 
-def hash_content(content: str) -> str:
-    """Create a hash of content for logging without exposing the content."""
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+# Chars encoded per hasher.update() for large str content
+_HASH_CHUNK = 1 << 16
+
+
+def hash_content(content: str | bytes) -> str:
+    """Create a hash of content for logging without exposing the content.
+
+    Large str content is encoded and hashed in slices, so a multi-MB write
+    doesn't need a second full-size UTF-8 copy. The digest is identical to
+    hashing the whole encoded content in one shot. Lone surrogates (valid in a
+    JSON string escape) are encoded with surrogatepass rather than raising.
+    """
+    # Imported here: hashlib loads the OpenSSL bindings (~3ms cold), and most
+    # file operations never reach a code path that hashes
+    import hashlib
+
+    if isinstance(content, bytes):
+        return hashlib.sha256(content).hexdigest()[:16]
+    if len(content) <= _HASH_CHUNK:
+        return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+    hasher = hashlib.sha256()
+    for start in range(0, len(content), _HASH_CHUNK):
+        hasher.update(content[start : start + _HASH_CHUNK].encode("utf-8", "surrogatepass"))
+    return hasher.hexdigest()[:16]
 
 
 def _resolve_path(file_path: str) -> str:
@@ -81,21 +212,32 @@ def _resolve_path(file_path: str) -> str:
     This ensures symlink-based bypass attacks are caught by normalizing
     all paths to their real filesystem location before checking.
     """
+    # os.path.realpath is what Path.resolve(strict=False) calls underneath;
+    # using it directly skips building the intermediate Path objects
+    expanded = os.path.expanduser(file_path)
     try:
-        return str(Path(file_path).expanduser().resolve(strict=False))
+        return os.path.realpath(expanded)
     except (OSError, ValueError):
         # If resolution fails, fall back to basic expansion
-        return str(Path(file_path).expanduser())
+        return expanded
 
 
-def check_path_blocked(file_path: str) -> tuple[bool, str | None]:
+def check_path_blocked(
+    file_path: str, normalized: str | None = None
+) -> tuple[bool, str | None]:
     """Check if a path is in the blocked list.
 
     Resolves symlinks to prevent bypass via indirect paths
     (e.g., ln -s /etc/shadow /tmp/safe && cat /tmp/safe).
+    Pass ``normalized`` (from _resolve_path) to skip resolving again.
     """
-    normalized = _resolve_path(file_path)
+    if normalized is None:
+        normalized = _resolve_path(file_path)
 
+    if not normalized.startswith(_BLOCKED_PREFIXES) and normalized not in _BLOCKED_EXACT:
+        return False, None
+
+    # Hit: find which entry matched, in list order, for the reason
     for blocked in BLOCKED_PATHS:
         if normalized.startswith(blocked) or normalized == blocked.rstrip("/"):
             return True, f"Blocked path: {blocked}"
@@ -103,45 +245,56 @@ def check_path_blocked(file_path: str) -> tuple[bool, str | None]:
     return False, None
 
 
-def check_path_sensitive(file_path: str) -> tuple[bool, str | None]:
+def check_path_sensitive(
+    file_path: str, normalized: str | None = None
+) -> tuple[bool, str | None]:
     """Check if a path is sensitive (warn but don't block).
 
     Resolves symlinks to prevent bypass via indirect paths.
+    Pass ``normalized`` (from _resolve_path) to skip resolving again.
     """
-    normalized = _resolve_path(file_path)
+    if normalized is None:
+        normalized = _resolve_path(file_path)
 
-    for sensitive in SENSITIVE_PATHS:
-        expanded = str(Path(sensitive).expanduser())
+    if not normalized.startswith(_SENSITIVE_PREFIXES):
+        return False, None
+
+    # Hit: find which entry matched, in list order, for the warning
+    for expanded, sensitive in _EXPANDED_SENSITIVE:
         if normalized.startswith(expanded):
             return True, f"Sensitive path: {sensitive}"
 
     return False, None
 
 
-def check_file_pattern(file_path: str) -> tuple[bool, str | None]:
+def check_file_pattern(
+    file_path: str, resolved: str | None = None
+) -> tuple[bool, str | None]:
     """Check if filename or path matches sensitive patterns.
 
     Checks both the original path and the resolved real path to catch
     symlink-based bypass attempts.
+    Pass ``resolved`` (from _resolve_path) to skip resolving again.
     """
-    resolved = _resolve_path(file_path)
+    if resolved is None:
+        resolved = _resolve_path(file_path)
     filename = Path(file_path).name
-    resolved_filename = Path(resolved).name
+    # resolved is already normalized (no trailing slash or dot segments), so
+    # basename gives the same result as Path(resolved).name
+    resolved_filename = os.path.basename(resolved)
 
-    for pattern, description in SENSITIVE_FILE_PATTERNS:
+    for matches, description in _FILE_PATTERNS_COMPILED:
         # Check original filename
-        if re.search(pattern, filename, re.IGNORECASE):
+        if matches(filename):
             return True, f"Sensitive file type: {description}"
         # Check resolved filename (catches symlinks with different names)
-        if resolved_filename != filename and re.search(
-            pattern, resolved_filename, re.IGNORECASE
-        ):
+        if resolved_filename != filename and matches(resolved_filename):
             return True, f"Sensitive file type: {description} (via symlink)"
         # Check full original path for directory-based patterns (e.g., .aws/)
-        if re.search(pattern, file_path, re.IGNORECASE):
+        if matches(file_path):
             return True, f"Sensitive file type: {description}"
         # Check full resolved path
-        if resolved != file_path and re.search(pattern, resolved, re.IGNORECASE):
+        if resolved != file_path and matches(resolved):
             return True, f"Sensitive file type: {description} (via symlink)"
 
     return False, None
@@ -152,8 +305,15 @@ def check_content_sensitive(content: str | None) -> tuple[bool, str | None, str
     if not content:
         return False, None, None
 
-    for pattern, description in SENSITIVE_CONTENT_PATTERNS:
-        if re.search(pattern, content):
+    if _CONTENT_LITERALS is not None and not any(
+        literal in content for literal in _CONTENT_LITERALS
+    ):
+        return False, None, None
+    if not _CONTENT_ANY.search(content):
+        return False, None, None
+
+    for regex, description in _CONTENT_PATTERNS_COMPILED:
+        if regex.search(content):
             return True, f"Content contains: {description}", hash_content(content)
 
     return False, None, None
@@ -176,50 +336,51 @@ def validate(
     Returns:
         {"safe": bool, "reason": str | None, "metadata": dict | None}
     """
-    # Extract file path from various possible field names
-    file_path = tool_input.get(
-        "file_path", tool_input.get("path", tool_input.get("target_file", ""))
-    )
-    content = tool_input.get("content", tool_input.get("new_content", ""))
+    # Extract file path from various possible field names (first key present
+    # wins); bail out before touching content when there is no path at all
+    if "file_path" in tool_input:
+        file_path = tool_input["file_path"]
+    elif "path" in tool_input:
+        file_path = tool_input["path"]
+    else:
+        file_path = tool_input.get("target_file", "")
 
     if not file_path:
         return {"safe": True}
 
+    if "content" in tool_input:
+        content = tool_input["content"]
+    else:
+        content = tool_input.get("new_content", "")
+
+    # Each return below is terminal, so metadata is filled in place, not copied
     metadata: dict[str, Any] = {"file_path": file_path}
 
+    # Resolve once (expanduser + symlinks) and share it across all path checks.
+    # Not memoized across calls: a symlink can be retargeted between calls.
+    normalized = _resolve_path(file_path)
+
     # Check blocked paths (hard block)
-    is_blocked, reason = check_path_blocked(file_path)
+    is_blocked, reason = check_path_blocked(file_path, normalized)
     if is_blocked:
-        return {
-            "safe": False,
-            "reason": reason,
-            "metadata": {**metadata, "risk_level": "critical"},
-        }
+        metadata["risk_level"] = "critical"
+        return {"safe": False, "reason": reason, "metadata": metadata}
 
     # Check sensitive file patterns (hard block for writes)
-    is_sensitive_file, file_reason = check_file_pattern(file_path)
+    is_sensitive_file, file_reason = check_file_pattern(file_path, normalized)
     if is_sensitive_file:
         # For read operations on sensitive files, redact instead of block
         operation = tool_input.get(
             "command", context.get("tool_name", "") if context else ""
         )
         if operation in ("Read", "read"):
-            return {
-                "safe": True,
-                "reason": None,
-                "metadata": {
-                    **metadata,
-                    "redacted": True,
-                    "redact_reason": file_reason,
-                    "content_hash": hash_content(content) if content else None,
-                },
-            }
+            metadata["redacted"] = True
+            metadata["redact_reason"] = file_reason
+            metadata["content_hash"] = hash_content(content) if content else None
+            return {"safe": True, "reason": None, "metadata": metadata}
         # Block writes to sensitive files
-        return {
-            "safe": False,
-            "reason": file_reason,
-            "metadata": {**metadata, "risk_level": "high"},
-        }
+        metadata["risk_level"] = "high"
+        return {"safe": False, "reason": file_reason, "metadata": metadata}
 
     # Check content for sensitive data (for write operations)
     if content:
@@ -227,18 +388,16 @@ def validate(
             content
         )
         if is_sensitive_content:
+            metadata["content_hash"] = content_hash
+            metadata["risk_level"] = "high"
             return {
                 "safe": False,
                 "reason": f"Cannot write sensitive content: {content_reason}",
-                "metadata": {
-                    **metadata,
-                    "content_hash": content_hash,
-                    "risk_level": "high",
-                },
+                "metadata": metadata,
             }
 
     # Check sensitive paths (warn but allow)
-    is_sensitive_path, path_reason = check_path_sensitive(file_path)
+    is_sensitive_path, path_reason = check_path_sensitive(file_path, normalized)
     if is_sensitive_path:
         metadata["warning"] = path_reason
         metadata["risk_level"] = "medium"
@@ -33,6 +33,13 @@ from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built against it; the pure-Python
+# SafeLoader is the fallback and parses identically.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 # Paths relative to agentic-primitives root
 ROOT = Path(__file__).parent.parent
 PROVIDERS_DIR = ROOT / "providers" / "workspaces"
@@ -49,7 +56,7 @@ def load_manifest(provider: str) -> dict:
         sys.exit(1)
 
     with manifest_path.open() as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def stage_dockerfile(provider: str, build_context: Path) -> None:
@@ -36,7 +36,37 @@ import sys
 import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TextIO
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _loads(line: str) -> Any:
+    """Parse JSON with orjson when available, accepting whatever stdlib json does."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or lone surrogates, which stdlib json accepts
+    return json.loads(line)
+
+
+def _parse_jsonl_event(line: str) -> dict | None:
+    """Parse a line as a JSONL event, or return None if it is not one."""
+    line = line.strip()
+    if not line.startswith("{"):
+        return None
+    try:
+        data = _loads(line)
+    except json.JSONDecodeError:
+        return None
+    # Hook events have event_type, Claude CLI has type
+    if "event_type" in data or "type" in data:
+        return data
+    return None
 
 
 def is_jsonl_event(line: str) -> bool:
@@ -46,23 +76,13 @@ def is_jsonl_event(line: str) -> bool:
     1. Hook events: {"event_type": "tool_execution_started", ...}
     2. Claude CLI native: {"type": "assistant", ...}
     """
-    line = line.strip()
-    if not line:
-        return False
-    if not line.startswith("{"):
-        return False
-    try:
-        data = json.loads(line)
-        # Hook events have event_type, Claude CLI has type
-        return "event_type" in data or "type" in data
-    except json.JSONDecodeError:
-        return False
+    return _parse_jsonl_event(line) is not None
 
 
 def parse_event(line: str) -> dict | None:
     """Parse a JSONL event line."""
     try:
-        return json.loads(line.strip())
+        return _loads(line.strip())
     except json.JSONDecodeError:
         return None
 
@@ -70,15 +90,13 @@ def parse_event(line: str) -> dict | None:
 def _process_event_line(
     line: str, start_time: float, verbose: bool,
 ) -> dict | None:
-    if not is_jsonl_event(line):
+    # One decode serves both the event check and the returned event
+    event = _parse_jsonl_event(line)
+    if event is None:
         if verbose:
             print(f"  [pass] {line.rstrip()}", file=sys.stderr)
         return None
 
-    event = parse_event(line)
-    if event is None:
-        return None
-
     offset_ms = int((time.monotonic() - start_time) * 1000)
     event["_offset_ms"] = offset_ms
 
@@ -22,6 +22,13 @@ except ImportError:
     print("Error: PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml C loader when PyYAML was built against it; the pure-Python
+# SafeLoader is the fallback and parses identically.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 BENCHMARKS_FILE = REPO_ROOT / "providers/workspaces/claude-cli/fixtures/benchmarks.yaml"
@@ -34,7 +41,7 @@ def load_benchmarks() -> dict:
         print(f"Error: Benchmarks file not found: {BENCHMARKS_FILE}")
         sys.exit(1)
     with open(BENCHMARKS_FILE) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
     return data.get("benchmarks", {})
 
 
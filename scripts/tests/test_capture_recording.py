@@ -45,6 +45,11 @@ class TestIsJsonlEvent:
         """Invalid JSON returns False."""
         assert is_jsonl_event("{invalid json}") is False
 
+    def test_stdlib_only_json_is_event(self):
+        """Lines only stdlib json accepts (NaN, lone surrogates) are still events."""
+        assert is_jsonl_event('{"type": "assistant", "cost": NaN}') is True
+        assert is_jsonl_event('{"type": "assistant", "text": "\\ud800"}') is True
+
 
 class TestParseEvent:
     """Tests for parse_event function."""